@@ -4,16 +4,35 @@ Bulk Filtered Import Script
 Imports data for all tables for the last 6 months starting from June 2025
 """
 
-import requests
-import json
-import time
+import aiohttp
+import asyncio
+import ijson
+import logging
+import orjson
+import random
+from collections import defaultdict
 from datetime import datetime
-from calendar import monthrange
 import sys
 
+# Buffered logger instead of print: one stdout lock/flush per handler emit,
+# so concurrent coroutines don't serialize on per-line print flushes
+logger = logging.getLogger("bulk_import")
+logger.setLevel(logging.INFO)
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+
 # Server configuration
 SERVER_URL = "http://localhost:3000"
-ENDPOINT = "/import-filtered-data"
+BATCH_ENDPOINT = "/import-filtered-data-batch"
+BATCH_URL = SERVER_URL + BATCH_ENDPOINT
+HEADERS = {"Content-Type": "application/json"}
+
+# How many import requests to keep in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Cap on a single retry backoff sleep
+MAX_BACKOFF_SECONDS = 30
 
 # All export IDs and their corresponding data types
 EXPORT_MAPPINGS = {
@@ -29,271 +48,394 @@ EXPORT_MAPPINGS = {
     "20357111093": {"name": "slaPolicy", "emoji": "📊", "description": "SLA policies"}
 }
 
+# Reverse lookup for the summary, so we don't rescan EXPORT_MAPPINGS per data type
+NAME_TO_EMOJI = {info['name']: info['emoji'] for info in EXPORT_MAPPINGS.values()}
+
+
+# Locale-independent month names and lengths, so date range generation
+# never touches strftime or calendar.monthrange
+MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December')
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def days_in_month(year, month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return DAYS_IN_MONTH[month - 1]
+
 
 def generate_date_ranges():
-    start_date = datetime(2025, 6, 29)
+    start_year, start_month = 2025, 6
     end_date = datetime.now()
     date_ranges = []
 
-    current = datetime(start_date.year, start_date.month, 1)
-
-    while current <= end_date:
-        year = current.year
-        month = current.month
+    year, month = start_year, start_month
 
-        # First day of the range
-        if current.month == 6 and current.year == 2025:
+    while (year, month) <= (end_date.year, end_date.month):
+        # First day of the range (the import window opens on 2025-06-29)
+        if (year, month) == (start_year, start_month):
             first_day = 29
         else:
             first_day = 1
 
         # Last day of the month or today if it's the current month
-        if year == end_date.year and month == end_date.month:
+        if (year, month) == (end_date.year, end_date.month):
             last_day = end_date.day
         else:
-            last_day = monthrange(year, month)[1]
-
-        start_str = f"{year:04d}-{month:02d}-{first_day:02d}"
-        end_str = f"{year:04d}-{month:02d}-{last_day:02d}"
-        month_name = datetime(year, month, 1).strftime("%B %Y")
+            last_day = days_in_month(year, month)
 
         date_ranges.append({
-            "start_date": start_str,
-            "end_date": end_str,
-            "month_name": month_name,
+            "start_date": f"{year:04d}-{month:02d}-{first_day:02d}",
+            "end_date": f"{year:04d}-{month:02d}-{last_day:02d}",
+            "month_name": f"{MONTH_NAMES[month - 1]} {year}",
             "year": year,
             "month": month
         })
 
         # Move to the next month
         if month == 12:
-            current = datetime(year + 1, 1, 1)
+            year, month = year + 1, 1
         else:
-            current = datetime(year, month + 1, 1)
+            month += 1
 
     return date_ranges
 
-def make_filtered_import_request(export_id, start_date, end_date, data_info, max_retries=3):
-    url = f"{SERVER_URL}{ENDPOINT}"
-    payload = {
-        "id": export_id,
-        "startDate": start_date,
-        "endDate": end_date
-    }
-    headers = {"Content-Type": "application/json"}
+# The only leaf paths we read from each job result; everything else is skipped
+RESPONSE_FIELDS = {
+    'success',
+    'message',
+    'duration',
+    'results.filteredRecordsFound',
+    'results.database.recordsInserted',
+    'results.database.duplicatesSkipped',
+    'results.jsonFile.filename',
+}
+
+# Prefix of the per-job result objects in a batch response
+BATCH_ITEM_PREFIX = 'results.item'
+
+
+async def parse_batch_response(stream, expected_jobs):
+    """Stream-parse a batch response, pulling only RESPONSE_FIELDS per job.
+
+    Returns one small dict per job result, in response order. Keeps a fixed
+    parser buffer instead of materializing the full response, which matters
+    now that every response carries a whole month of import results. Raises
+    ValueError if the server returned a different number of results than
+    jobs were sent.
+    """
+    # The job count is known up front, so pre-size the results list
+    # instead of growing it append-by-append
+    items = [None] * expected_jobs
+    count = 0
+    fields = None
+
+    async for prefix, event, value in ijson.parse(stream):
+        if prefix == BATCH_ITEM_PREFIX:
+            if event == 'start_map':
+                fields = {}
+            elif event == 'end_map':
+                if count < expected_jobs:
+                    items[count] = fields
+                count += 1
+                fields = None
+        elif fields is not None and event in ('boolean', 'number', 'string', 'null'):
+            field = prefix[len(BATCH_ITEM_PREFIX) + 1:]
+            if field in RESPONSE_FIELDS:
+                fields[field] = value
+
+    if count != expected_jobs:
+        raise ValueError(f"Batch response had {count} results for {expected_jobs} jobs")
+
+    return items
+
+
+def parse_retry_after(header_value):
+    """Parse a Retry-After header into seconds, or None if absent/unusable."""
+    if not header_value:
+        return None
+    try:
+        return min(float(header_value), MAX_BACKOFF_SECONDS)
+    except ValueError:
+        return None
+
+
+def unpack_job_result(export_id, data_info, fields):
+    if fields.get('success'):
+        records_found = fields.get('results.filteredRecordsFound', 0)
+        records_inserted = fields.get('results.database.recordsInserted', 0)
+        duplicates = fields.get('results.database.duplicatesSkipped', 0)
+        duration = fields.get('duration', 'Unknown')
+
+        logger.info(f"  ✅ {data_info['emoji']} {data_info['name']}: {records_found} found, {records_inserted} inserted, {duplicates} duplicates, {duration}")
+        return {
+            'success': True,
+            'export_id': export_id,
+            'data_type': data_info['name'],
+            'records_found': records_found,
+            'records_inserted': records_inserted,
+            'duplicates_skipped': duplicates,
+            'duration': duration,
+            'json_file': fields.get('results.jsonFile.filename', 'N/A')
+        }
+    else:
+        error_msg = fields.get('message', 'Unknown error') if fields else 'Empty response'
+        logger.info(f"  ❌ {data_info['emoji']} {data_info['name']}: {error_msg}")
+        return {
+            'success': False,
+            'export_id': export_id,
+            'data_type': data_info['name'],
+            'error': error_msg
+        }
+
+
+async def make_batch_import_request(session, date_range, max_retries=3):
+    """POST one batch covering every export for a single month.
+
+    One round trip carries len(EXPORT_MAPPINGS) jobs, cutting the request
+    count ~10x versus one request per (export, month) pair. The batch
+    response is unrolled back into the familiar per-job result dicts.
+    """
+    jobs = [
+        {
+            "id": export_id,
+            "startDate": date_range['start_date'],
+            "endDate": date_range['end_date']
+        }
+        for export_id in EXPORT_MAPPINGS
+    ]
+    # The payload never changes between attempts, so serialize it once
+    # instead of re-encoding the dict on every retry
+    body = orjson.dumps({"jobs": jobs})
 
     for attempt in range(1, max_retries + 1):
+        retry_after = None
         try:
-            print(f"  🔄 Requesting {data_info['name']} data (Attempt {attempt}/{max_retries})...")
-            response = requests.post(url, json=payload, headers=headers, timeout=300)
-
-            print(f"    📡 Response status: {response.status_code}")
-            print(f"    📄 Response content type: {response.headers.get('content-type', 'unknown')}")
-
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result and result.get('success'):
-                        results_data = result.get('results') or {}
-                        database_data = results_data.get('database') or {}
-
-                        records_found = results_data.get('filteredRecordsFound', 0)
-                        records_inserted = database_data.get('recordsInserted', 0)
-                        duplicates = database_data.get('duplicatesSkipped', 0)
-                        duration = result.get('duration', 'Unknown')
-
-                        print(f"  ✅ {data_info['emoji']} {data_info['name']}: {records_found} found, {records_inserted} inserted, {duplicates} duplicates, {duration}")
-                        return {
-                            'success': True,
-                            'export_id': export_id,
-                            'data_type': data_info['name'],
-                            'records_found': records_found,
-                            'records_inserted': records_inserted,
-                            'duplicates_skipped': duplicates,
-                            'duration': duration,
-                            'json_file': results_data.get('jsonFile', {}).get('filename', 'N/A'),
-                            'response': result
-                        }
-                    else:
-                        error_msg = result.get('message', 'Unknown error') if result else 'Empty response'
-                        raise ValueError(f"Response error: {error_msg}")
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON response: {str(e)}\nRaw response: {response.text[:300]}")
-            else:
-                raise ValueError(f"HTTP {response.status_code} - {response.text[:300]}")
+            logger.info(f"  🔄 Requesting {date_range['month_name']} batch ({len(jobs)} jobs, Attempt {attempt}/{max_retries})...")
+            async with session.post(BATCH_URL, data=body, headers=HEADERS,
+                                    timeout=aiohttp.ClientTimeout(total=300)) as response:
+
+                logger.info(f"    📡 Response status: {response.status}")
+                logger.info(f"    📄 Response content type: {response.headers.get('content-type', 'unknown')}")
+
+                if response.status == 200:
+                    try:
+                        items = await parse_batch_response(response.content, len(jobs))
+                    except ijson.JSONError as e:
+                        raise ValueError(f"Invalid JSON response: {str(e)}")
+
+                    return [
+                        unpack_job_result(export_id, data_info, fields)
+                        for (export_id, data_info), fields in zip(EXPORT_MAPPINGS.items(), items)
+                    ]
+                else:
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    raw_text = await response.text()
+                    raise ValueError(f"HTTP {response.status} - {raw_text[:300]}")
         except Exception as e:
-            print(f"  ❌ {data_info['emoji']} {data_info['name']} attempt {attempt} failed: {e}")
+            logger.info(f"  ❌ {date_range['month_name']} batch attempt {attempt} failed: {e}")
             if attempt < max_retries:
-                wait = 2 ** attempt
-                print(f"    ⏳ Retrying in {wait} seconds...")
-                time.sleep(wait)
+                if retry_after is not None:
+                    # The server told us when to come back; honor it
+                    wait = retry_after
+                else:
+                    # Full jitter: spreads concurrent retries out instead of
+                    # having every in-flight request hammer the server in lockstep
+                    wait = random.uniform(0, min(2 ** attempt, MAX_BACKOFF_SECONDS))
+                logger.info(f"    ⏳ Retrying in {wait:.1f} seconds...")
+                await asyncio.sleep(wait)
             else:
-                return {
-                    'success': False,
-                    'export_id': export_id,
-                    'data_type': data_info['name'],
-                    'error': str(e)
-                }
+                return [
+                    {
+                        'success': False,
+                        'export_id': export_id,
+                        'data_type': data_info['name'],
+                        'error': str(e)
+                    }
+                    for export_id, data_info in EXPORT_MAPPINGS.items()
+                ]
+
+
+async def run_month_batch(semaphore, session, date_range, batch_number, total_batches, results_file, stats):
+    async with semaphore:
+        logger.info(f"  [{batch_number}/{total_batches}] 📦 {date_range['month_name']} ({date_range['start_date']} to {date_range['end_date']})...")
+
+        results = await make_batch_import_request(session, date_range)
+
+        first_operation = (batch_number - 1) * len(EXPORT_MAPPINGS)
+        timestamp = datetime.now().isoformat()
+        for offset, result in enumerate(results):
+            result['month_name'] = date_range['month_name']
+            result['start_date'] = date_range['start_date']
+            result['end_date'] = date_range['end_date']
+            result['operation_number'] = first_operation + offset + 1
+            result['timestamp'] = timestamp
+
+            # One JSONL line per result, written as soon as it lands, so a
+            # crash or Ctrl-C mid-run loses nothing already completed
+            results_file.write(orjson.dumps(result, default=str) + b'\n')
+            record_result(stats, result)
+
 
+async def run_all(session, date_ranges, results_file, stats):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    total_batches = len(date_ranges)
 
-def test_server_connectivity():
+    tasks = [
+        run_month_batch(semaphore, session, date_range, batch_number, total_batches, results_file, stats)
+        for batch_number, date_range in enumerate(date_ranges, start=1)
+    ]
+
+    await asyncio.gather(*tasks)
+
+
+async def test_server_connectivity(session):
     try:
-        response = requests.get(f"{SERVER_URL}/health", timeout=10)
-        if response.status_code == 200:
-            health_data = response.json()
-            print(f"✅ Server is reachable: {health_data.get('status', 'OK')}")
-            return True
-        else:
-            print(f"❌ Server returned {response.status_code}")
-            return False
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Cannot connect to server: {e}")
+        async with session.get(f"{SERVER_URL}/health",
+                               timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                health_data = orjson.loads(await response.read())
+                logger.info(f"✅ Server is reachable: {health_data.get('status', 'OK')}")
+                return True
+            else:
+                logger.info(f"❌ Server returned {response.status}")
+                return False
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.info(f"❌ Cannot connect to server: {e}")
         return False
 
 
-def save_results_to_file(results, filename):
-    try:
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"💾 Results saved to: {filename}")
-    except Exception as e:
-        print(f"❌ Failed to save results: {e}")
-
-
-def print_summary(all_results):
-    print(f"\n{'='*60}")
-    print(f"📊 BULK IMPORT SUMMARY")
-    print(f"{'='*60}")
-
-    total_operations = len(all_results)
-    successful_operations = sum(1 for result in all_results if result['success'])
-    failed_operations = total_operations - successful_operations
-
-    total_records_found = sum(result.get('records_found', 0) for result in all_results if result['success'])
-    total_records_inserted = sum(result.get('records_inserted', 0) for result in all_results if result['success'])
-    total_duplicates = sum(result.get('duplicates_skipped', 0) for result in all_results if result['success'])
-
-    print(f"📈 Operations: {successful_operations}/{total_operations} successful ({failed_operations} failed)")
-    print(f"📊 Records Found: {total_records_found:,}")
-    print(f"💾 Records Inserted: {total_records_inserted:,}")
-    print(f"🔄 Duplicates Skipped: {total_duplicates:,}")
-
-    print(f"\n📅 Results by Month:")
-    month_results = {}
-    for result in all_results:
-        month = result.get('month_name', 'Unknown')
-        if month not in month_results:
-            month_results[month] = {'success': 0, 'failed': 0, 'records': 0}
-        if result['success']:
-            month_results[month]['success'] += 1
-            month_results[month]['records'] += result.get('records_inserted', 0)
-        else:
-            month_results[month]['failed'] += 1
-
-    for month, stats in month_results.items():
-        print(f"  {month}: {stats['success']} success, {stats['failed']} failed, {stats['records']:,} records")
-
-    print(f"\n📋 Results by Data Type:")
-    type_results = {}
-    for result in all_results:
-        data_type = result.get('data_type', 'Unknown')
-        if data_type not in type_results:
-            type_results[data_type] = {'success': 0, 'failed': 0, 'records': 0}
-        if result['success']:
-            type_results[data_type]['success'] += 1
-            type_results[data_type]['records'] += result.get('records_inserted', 0)
-        else:
-            type_results[data_type]['failed'] += 1
+def new_run_stats():
+    return {
+        'total_operations': 0,
+        'successful_operations': 0,
+        'records_found': 0,
+        'records_inserted': 0,
+        'duplicates_skipped': 0,
+        'month_results': defaultdict(lambda: {'success': 0, 'failed': 0, 'records': 0}),
+        'type_results': defaultdict(lambda: {'success': 0, 'failed': 0, 'records': 0}),
+        'failures': []
+    }
+
+
+def record_result(stats, result):
+    """Fold one operation result into the running totals."""
+    month_stats = stats['month_results'][result.get('month_name', 'Unknown')]
+    type_stats = stats['type_results'][result.get('data_type', 'Unknown')]
+
+    stats['total_operations'] += 1
+
+    if result['success']:
+        records_inserted = result.get('records_inserted', 0)
+
+        stats['successful_operations'] += 1
+        stats['records_found'] += result.get('records_found', 0)
+        stats['records_inserted'] += records_inserted
+        stats['duplicates_skipped'] += result.get('duplicates_skipped', 0)
+
+        month_stats['success'] += 1
+        month_stats['records'] += records_inserted
+        type_stats['success'] += 1
+        type_stats['records'] += records_inserted
+    else:
+        month_stats['failed'] += 1
+        type_stats['failed'] += 1
+        stats['failures'].append(result)
+
+
+def print_summary(stats):
+    logger.info(f"\n{'='*60}")
+    logger.info(f"📊 BULK IMPORT SUMMARY")
+    logger.info(f"{'='*60}")
+
+    failed_operations = stats['total_operations'] - stats['successful_operations']
+
+    logger.info(f"📈 Operations: {stats['successful_operations']}/{stats['total_operations']} successful ({failed_operations} failed)")
+    logger.info(f"📊 Records Found: {stats['records_found']:,}")
+    logger.info(f"💾 Records Inserted: {stats['records_inserted']:,}")
+    logger.info(f"🔄 Duplicates Skipped: {stats['duplicates_skipped']:,}")
 
-    for data_type, stats in sorted(type_results.items()):
-        emoji = next((info['emoji'] for info in EXPORT_MAPPINGS.values() if info['name'] == data_type), '📊')
-        print(f"  {emoji} {data_type}: {stats['success']} success, {stats['failed']} failed, {stats['records']:,} records")
+    logger.info(f"\n📅 Results by Month:")
+    for month, month_stats in stats['month_results'].items():
+        logger.info(f"  {month}: {month_stats['success']} success, {month_stats['failed']} failed, {month_stats['records']:,} records")
 
-    if failed_operations > 0:
-        print(f"\n❌ Failed Operations:")
-        for result in all_results:
-            if not result['success']:
-                print(f"  • {result.get('data_type', 'Unknown')} ({result.get('month_name', 'Unknown')}): {result.get('error', 'Unknown error')}")
+    logger.info(f"\n📋 Results by Data Type:")
+    for data_type, type_stats in sorted(stats['type_results'].items()):
+        emoji = NAME_TO_EMOJI.get(data_type, '📊')
+        logger.info(f"  {emoji} {data_type}: {type_stats['success']} success, {type_stats['failed']} failed, {type_stats['records']:,} records")
 
+    if stats['failures']:
+        logger.info(f"\n❌ Failed Operations:")
+        for result in stats['failures']:
+            logger.info(f"  • {result.get('data_type', 'Unknown')} ({result.get('month_name', 'Unknown')}): {result.get('error', 'Unknown error')}")
 
-def main():
-    print("🚀 Bulk Filtered Import Script")
-    print("📅 Importing data for all tables for the last 6 months starting from June 2025")
-    print(f"🌐 Server: {SERVER_URL}")
 
-    print(f"\n🔍 Testing server connectivity...")
-    if not test_server_connectivity():
-        print("❌ Cannot proceed without server connection")
+async def main():
+    logger.info("🚀 Bulk Filtered Import Script")
+    logger.info("📅 Importing data for all tables for the last 6 months starting from June 2025")
+    logger.info(f"🌐 Server: {SERVER_URL}")
+
+    # One pooled session (keep-alive) shared by the health check and every import request
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, limit_per_host=MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await run_import(session)
+
+
+async def run_import(session):
+    logger.info(f"\n🔍 Testing server connectivity...")
+    if not await test_server_connectivity(session):
+        logger.info("❌ Cannot proceed without server connection")
         sys.exit(1)
 
     date_ranges = generate_date_ranges()
 
-    print(f"\n📅 Date ranges to process:")
+    logger.info(f"\n📅 Date ranges to process:")
     for dr in date_ranges:
-        print(f"  • {dr['month_name']}: {dr['start_date']} to {dr['end_date']}")
+        logger.info(f"  • {dr['month_name']}: {dr['start_date']} to {dr['end_date']}")
 
-    print(f"\n📋 Data types to process:")
+    logger.info(f"\n📋 Data types to process:")
     for export_id, info in EXPORT_MAPPINGS.items():
-        print(f"  • {info['emoji']} {info['name']} (ID: {export_id})")
+        logger.info(f"  • {info['emoji']} {info['name']} (ID: {export_id})")
 
     total_operations = len(date_ranges) * len(EXPORT_MAPPINGS)
-    print(f"\n🎯 Total operations to perform: {total_operations}")
+    total_batches = len(date_ranges)
+    logger.info(f"\n🎯 Total operations to perform: {total_operations} ({total_batches} batched requests)")
+    logger.info(f"⚡ Concurrency: up to {MAX_CONCURRENT_REQUESTS} requests in flight")
 
     if len(sys.argv) > 1 and sys.argv[1] == '--auto':
-        print("🤖 Auto mode enabled, proceeding without confirmation...")
+        logger.info("🤖 Auto mode enabled, proceeding without confirmation...")
     else:
-        confirm = input(f"\n⚠️  This will make {total_operations} API requests. Continue? (y/N): ")
+        confirm = input(f"\n⚠️  This will make {total_batches} API requests. Continue? (y/N): ")
         if confirm.lower() not in ['y', 'yes']:
-            print("❌ Operation cancelled by user")
+            logger.info("❌ Operation cancelled by user")
             sys.exit(0)
 
-    all_results = []
-    operation_count = 0
-
-    print(f"\n{'='*60}")
-    print(f"🚀 STARTING BULK IMPORT")
-    print(f"{'='*60}")
-
-    for date_range in date_ranges:
-        print(f"\n📅 Processing {date_range['month_name']} ({date_range['start_date']} to {date_range['end_date']})")
-
-        for export_id, data_info in EXPORT_MAPPINGS.items():
-            operation_count += 1
-            print(f"  [{operation_count}/{total_operations}] {data_info['emoji']} {data_info['name']}...")
-
-            result = make_filtered_import_request(
-                export_id,
-                date_range['start_date'],
-                date_range['end_date'],
-                data_info
-            )
-
-            result['month_name'] = date_range['month_name']
-            result['start_date'] = date_range['start_date']
-            result['end_date'] = date_range['end_date']
-            result['operation_number'] = operation_count
-            result['timestamp'] = datetime.now().isoformat()
-
-            all_results.append(result)
-            time.sleep(1)
+    logger.info(f"\n{'='*60}")
+    logger.info(f"🚀 STARTING BULK IMPORT")
+    logger.info(f"{'='*60}")
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_filename = f'bulk_import_results_{timestamp}.json'
-    save_results_to_file(all_results, results_filename)
+    results_filename = f'bulk_import_results_{timestamp}.jsonl'
+    stats = new_run_stats()
+
+    with open(results_filename, 'wb') as results_file:
+        await run_all(session, date_ranges, results_file, stats)
 
-    print_summary(all_results)
+    logger.info(f"💾 Results saved to: {results_filename}")
+    print_summary(stats)
 
-    print(f"\n🎉 Bulk import completed!")
-    print(f"📁 Detailed results saved to: {results_filename}")
-    print(f"💾 JSON export files should be in: ./exports/")
+    logger.info(f"\n🎉 Bulk import completed!")
+    logger.info(f"📁 Detailed results saved to: {results_filename}")
+    logger.info(f"💾 JSON export files should be in: ./exports/")
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
-        print(f"\n\n❌ Script interrupted by user")
+        logger.info(f"\n\n❌ Script interrupted by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
+        logger.info(f"\n❌ Unexpected error: {e}")
         sys.exit(1)
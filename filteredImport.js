@@ -477,191 +477,206 @@ async function saveFilteredDataToJSON(filteredData, dataType, exportId, startDat
   }
 }
 
-// Main filtered data import function
-async function importFilteredData(req, res) {
+// Validate one filtered import job's parameters; returns an error payload or null
+function validateFilteredImportParams(id, startDate, endDate) {
+  if (!id || !startDate || !endDate) {
+    return {
+      success: false,
+      message: 'Missing required fields: id, startDate, endDate',
+      example: {
+        id: '5002645397',
+        startDate: '2025-04-01',
+        endDate: '2025-04-30'
+      }
+    };
+  }
+
+  // Validate date format (YYYY-MM-DD)
+  const dateRegex = /^\d{4}-\d{2}-\d{2}$/;
+  if (!dateRegex.test(startDate) || !dateRegex.test(endDate)) {
+    return {
+      success: false,
+      message: 'Invalid date format. Use YYYY-MM-DD format',
+      provided: { startDate, endDate }
+    };
+  }
+
+  // Validate date range
+  if (new Date(endDate) < new Date(startDate)) {
+    return {
+      success: false,
+      message: 'End date cannot be before start date',
+      provided: { startDate, endDate }
+    };
+  }
+
+  // Check if export ID is supported
+  if (!EXPORT_ID_MAPPING[id]) {
+    return {
+      success: false,
+      message: 'Unsupported export ID',
+      supportedIds: Object.keys(EXPORT_ID_MAPPING),
+      provided: id
+    };
+  }
+
+  return null;
+}
+
+// Run one filtered import job (download, filter, export, append) and return its result
+async function runFilteredImportJob(id, startDate, endDate) {
   const startTime = Date.now();
+  const exportConfig = EXPORT_ID_MAPPING[id];
+
+  logger(`${exportConfig.emoji} Starting filtered import for ${exportConfig.name}...`);
+  logger(`📊 Export ID: ${id}`);
+  logger(`📅 Date Range: ${startDate} to ${endDate}`);
   
-  try {
-    // Validate request body
-    const { id, startDate, endDate } = req.body;
-    
-    if (!id || !startDate || !endDate) {
-      return res.status(400).json({
-        success: false,
-        message: 'Missing required fields: id, startDate, endDate',
-        example: {
-          id: '5002645397',
-          startDate: '2025-04-01',
-          endDate: '2025-04-30'
-        }
-      });
-    }
-    
-    // Validate date format (YYYY-MM-DD)
-    const dateRegex = /^\d{4}-\d{2}-\d{2}$/;
-    if (!dateRegex.test(startDate) || !dateRegex.test(endDate)) {
-      return res.status(400).json({
-        success: false,
-        message: 'Invalid date format. Use YYYY-MM-DD format',
-        provided: { startDate, endDate }
-      });
+  // Build the API URL
+  const apiUrl = `${API_CONFIG.baseUrl}/${id}/actions/run?csv=true&access-token=${API_CONFIG.token}&client=${API_CONFIG.client}&uid=${API_CONFIG.uid}`;
+  
+  // Try different URL variations with date filters
+  const urlVariations = [
+    // Try with date range filters
+    `${apiUrl}&created_at_from=${startDate}&created_at_to=${endDate}`,
+    `${apiUrl}&updated_at_from=${startDate}&updated_at_to=${endDate}`,
+    `${apiUrl}&date_from=${startDate}&date_to=${endDate}`,
+    `${apiUrl}&start_date=${startDate}&end_date=${endDate}`,
+    // Fallback to original URL
+    apiUrl
+  ];
+  
+  let allData = null;
+  let methodUsed = 0;
+  
+  for (let i = 0; i < urlVariations.length; i++) {
+    try {
+      logger(`🔄 Trying method ${i + 1}: API date filtering...`);
+      allData = await downloadAndParseCSV(urlVariations[i], exportConfig.name);
+      methodUsed = i + 1;
+      break;
+    } catch (error) {
+      if (i === urlVariations.length - 1) {
+        throw error; // Re-throw if this was the last attempt
+      }
+      logger(`❌ Method ${i + 1} failed, trying next approach...`);
     }
-    
-    // Validate date range
-    if (new Date(endDate) < new Date(startDate)) {
-      return res.status(400).json({
-        success: false,
-        message: 'End date cannot be before start date',
-        provided: { startDate, endDate }
-      });
+  }
+  
+  if (!allData) {
+    throw new Error('Failed to retrieve data with any method');
+  }
+  
+  logger(`✅ Retrieved ${allData.length} total records using method ${methodUsed}`);
+  
+  // Check if data already seems to be filtered by the API
+  let filteredData;
+  if (methodUsed < urlVariations.length) {
+    // API might have already filtered the data, but let's double-check
+    filteredData = filterDataByDateRange(allData, startDate, endDate, exportConfig.name);
+    
+    // If no records found with date filtering, try pattern analysis as fallback
+    if (filteredData.length === 0 && allData.length > 0) {
+      logger('⚠️ No records found with date field filtering, trying pattern analysis...');
+      filteredData = analyzeDataForDatePatterns(allData, startDate, endDate, exportConfig.name);
     }
+  } else {
+    // Definitely need to filter manually since we used the fallback URL
+    filteredData = filterDataByDateRange(allData, startDate, endDate, exportConfig.name);
     
-    // Check if export ID is supported
-    const exportConfig = EXPORT_ID_MAPPING[id];
-    if (!exportConfig) {
-      return res.status(400).json({
-        success: false,
-        message: 'Unsupported export ID',
-        supportedIds: Object.keys(EXPORT_ID_MAPPING),
-        provided: id
-      });
+    if (filteredData.length === 0) {
+      filteredData = analyzeDataForDatePatterns(allData, startDate, endDate, exportConfig.name);
     }
-    
-    logger(`${exportConfig.emoji} Starting filtered import for ${exportConfig.name}...`);
-    logger(`📊 Export ID: ${id}`);
-    logger(`📅 Date Range: ${startDate} to ${endDate}`);
-    
-    // Build the API URL
-    const apiUrl = `${API_CONFIG.baseUrl}/${id}/actions/run?csv=true&access-token=${API_CONFIG.token}&client=${API_CONFIG.client}&uid=${API_CONFIG.uid}`;
-    
-    // Try different URL variations with date filters
-    const urlVariations = [
-      // Try with date range filters
-      `${apiUrl}&created_at_from=${startDate}&created_at_to=${endDate}`,
-      `${apiUrl}&updated_at_from=${startDate}&updated_at_to=${endDate}`,
-      `${apiUrl}&date_from=${startDate}&date_to=${endDate}`,
-      `${apiUrl}&start_date=${startDate}&end_date=${endDate}`,
-      // Fallback to original URL
-      apiUrl
-    ];
-    
-    let allData = null;
-    let methodUsed = 0;
-    
-    for (let i = 0; i < urlVariations.length; i++) {
-      try {
-        logger(`🔄 Trying method ${i + 1}: API date filtering...`);
-        allData = await downloadAndParseCSV(urlVariations[i], exportConfig.name);
-        methodUsed = i + 1;
-        break;
-      } catch (error) {
-        if (i === urlVariations.length - 1) {
-          throw error; // Re-throw if this was the last attempt
-        }
-        logger(`❌ Method ${i + 1} failed, trying next approach...`);
-      }
+  }
+  
+  // Save filtered data to JSON file
+  const jsonFileInfo = await saveFilteredDataToJSON(
+    filteredData, 
+    exportConfig.name, 
+    id, 
+    startDate, 
+    endDate
+  );
+  
+  // Save filtered data to database if any records found
+  let databaseResult = null;
+  if (filteredData.length > 0) {
+    logger(`💾 Appending ${filteredData.length} filtered records to existing database data...`);
+    const appendResult = await exportConfig.handler(filteredData);
+    databaseResult = {
+      recordsProcessed: filteredData.length,
+      recordsInserted: appendResult.inserted || filteredData.length,
+      duplicatesSkipped: appendResult.duplicates || 0,
+      errors: appendResult.errors || 0,
+      tableName: exportConfig.name,
+      preservedExisting: true,
+      note: appendResult.note || 'Data appended without clearing existing records'
+    };
+    logger(`✅ Successfully appended ${appendResult.inserted || filteredData.length} new records to ${exportConfig.name} table`);
+    if (appendResult.duplicates > 0) {
+      logger(`ℹ️ Skipped ${appendResult.duplicates} duplicate records`);
     }
-    
-    if (!allData) {
-      throw new Error('Failed to retrieve data with any method');
+    if (appendResult.errors > 0) {
+      logger(`⚠️ ${appendResult.errors} records had errors during insertion`);
     }
-    
-    logger(`✅ Retrieved ${allData.length} total records using method ${methodUsed}`);
-    
-    // Check if data already seems to be filtered by the API
-    let filteredData;
-    if (methodUsed < urlVariations.length) {
-      // API might have already filtered the data, but let's double-check
-      filteredData = filterDataByDateRange(allData, startDate, endDate, exportConfig.name);
-      
-      // If no records found with date filtering, try pattern analysis as fallback
-      if (filteredData.length === 0 && allData.length > 0) {
-        logger('⚠️ No records found with date field filtering, trying pattern analysis...');
-        filteredData = analyzeDataForDatePatterns(allData, startDate, endDate, exportConfig.name);
-      }
-    } else {
-      // Definitely need to filter manually since we used the fallback URL
-      filteredData = filterDataByDateRange(allData, startDate, endDate, exportConfig.name);
-      
-      if (filteredData.length === 0) {
-        filteredData = analyzeDataForDatePatterns(allData, startDate, endDate, exportConfig.name);
-      }
-    }
-    
-    // Save filtered data to JSON file
-    const jsonFileInfo = await saveFilteredDataToJSON(
-      filteredData, 
-      exportConfig.name, 
-      id, 
-      startDate, 
+  } else {
+    logger('⚠️ No filtered records to save to database');
+  }
+  
+  const duration = Date.now() - startTime;
+  
+  // Prepare response
+  const response = {
+    success: true,
+    message: filteredData.length > 0 
+      ? `Successfully processed ${filteredData.length} filtered records`
+      : 'No records found in the specified date range',
+    exportId: id,
+    dataType: exportConfig.name,
+    dateRange: {
+      startDate,
       endDate
-    );
-    
-    // Save filtered data to database if any records found
-    let databaseResult = null;
-    if (filteredData.length > 0) {
-      logger(`💾 Appending ${filteredData.length} filtered records to existing database data...`);
-      const appendResult = await exportConfig.handler(filteredData);
-      databaseResult = {
-        recordsProcessed: filteredData.length,
-        recordsInserted: appendResult.inserted || filteredData.length,
-        duplicatesSkipped: appendResult.duplicates || 0,
-        errors: appendResult.errors || 0,
-        tableName: exportConfig.name,
-        preservedExisting: true,
-        note: appendResult.note || 'Data appended without clearing existing records'
-      };
-      logger(`✅ Successfully appended ${appendResult.inserted || filteredData.length} new records to ${exportConfig.name} table`);
-      if (appendResult.duplicates > 0) {
-        logger(`ℹ️ Skipped ${appendResult.duplicates} duplicate records`);
-      }
-      if (appendResult.errors > 0) {
-        logger(`⚠️ ${appendResult.errors} records had errors during insertion`);
-      }
-    } else {
-      logger('⚠️ No filtered records to save to database');
+    },
+    results: {
+      totalRecordsRetrieved: allData.length,
+      filteredRecordsFound: filteredData.length,
+      methodUsed: methodUsed,
+      jsonFile: jsonFileInfo,
+      database: databaseResult
+    },
+    duration: `${(duration / 1000).toFixed(2)}s`
+  };
+  
+  // Log summary
+  logger(`\n${exportConfig.emoji} FILTERED IMPORT COMPLETED ${exportConfig.emoji}`);
+  logger(`Export: ${exportConfig.name} (ID: ${id})`);
+  logger(`Date Range: ${startDate} to ${endDate}`);
+  logger(`Total Records: ${allData.length}`);
+  logger(`Filtered Records: ${filteredData.length}`);
+  logger(`JSON File: ${jsonFileInfo.filename}`);
+  logger(`Database: ${databaseResult ? `${databaseResult.recordsInserted} inserted, ${databaseResult.duplicatesSkipped} duplicates skipped` : 'No changes'}`);
+  logger(`Duration: ${(duration / 1000).toFixed(2)}s`);
+  logger(`Previous Data: Preserved ✅`);
+
+  return response;
+}
+
+// Main filtered data import function
+async function importFilteredData(req, res) {
+  try {
+    const { id, startDate, endDate } = req.body;
+
+    const validationError = validateFilteredImportParams(id, startDate, endDate);
+    if (validationError) {
+      return res.status(400).json(validationError);
     }
-    
-    const duration = Date.now() - startTime;
-    
-    // Prepare response
-    const response = {
-      success: true,
-      message: filteredData.length > 0 
-        ? `Successfully processed ${filteredData.length} filtered records`
-        : 'No records found in the specified date range',
-      exportId: id,
-      dataType: exportConfig.name,
-      dateRange: {
-        startDate,
-        endDate
-      },
-      results: {
-        totalRecordsRetrieved: allData.length,
-        filteredRecordsFound: filteredData.length,
-        methodUsed: methodUsed,
-        jsonFile: jsonFileInfo,
-        database: databaseResult
-      },
-      duration: `${(duration / 1000).toFixed(2)}s`
-    };
-    
-    // Log summary
-    logger(`\n${exportConfig.emoji} FILTERED IMPORT COMPLETED ${exportConfig.emoji}`);
-    logger(`Export: ${exportConfig.name} (ID: ${id})`);
-    logger(`Date Range: ${startDate} to ${endDate}`);
-    logger(`Total Records: ${allData.length}`);
-    logger(`Filtered Records: ${filteredData.length}`);
-    logger(`JSON File: ${jsonFileInfo.filename}`);
-    logger(`Database: ${databaseResult ? `${databaseResult.recordsInserted} inserted, ${databaseResult.duplicatesSkipped} duplicates skipped` : 'No changes'}`);
-    logger(`Duration: ${(duration / 1000).toFixed(2)}s`);
-    logger(`Previous Data: Preserved ✅`);
-    
+
+    const response = await runFilteredImportJob(id, startDate, endDate);
     res.json(response);
-    
+
   } catch (error) {
     logError('🔥 Filtered import failed', error);
-    
+
     const errorResponse = {
       success: false,
       message: 'Filtered import failed',
@@ -670,23 +685,99 @@ async function importFilteredData(req, res) {
       supportedExportIds: Object.keys(EXPORT_ID_MAPPING),
       dateFormat: 'YYYY-MM-DD'
     };
-    
+
     res.status(500).json(errorResponse);
   }
 }
 
+// Batched filtered data import - runs several jobs in one request/response round trip
+async function importFilteredDataBatch(req, res) {
+  const startTime = Date.now();
+
+  try {
+    const { jobs } = req.body;
+
+    if (!Array.isArray(jobs) || jobs.length === 0) {
+      return res.status(400).json({
+        success: false,
+        message: 'Request body must contain a non-empty jobs array',
+        example: {
+          jobs: [
+            { id: '5002645397', startDate: '2025-04-01', endDate: '2025-04-30' }
+          ]
+        }
+      });
+    }
+
+    logger(`📦 Starting batched filtered import (${jobs.length} jobs)...`);
+
+    const results = [];
+    for (const job of jobs) {
+      const { id, startDate, endDate } = job || {};
+
+      const validationError = validateFilteredImportParams(id, startDate, endDate);
+      if (validationError) {
+        results.push(validationError);
+        continue;
+      }
+
+      try {
+        results.push(await runFilteredImportJob(id, startDate, endDate));
+      } catch (error) {
+        logError(`🔥 Batched filtered import job failed for export ${id}`, error);
+        results.push({
+          success: false,
+          message: 'Filtered import failed',
+          error: error.message,
+          exportId: id,
+          dataType: EXPORT_ID_MAPPING[id].name,
+          dateRange: { startDate, endDate }
+        });
+      }
+    }
+
+    const duration = Date.now() - startTime;
+    const succeeded = results.filter(result => result.success).length;
+
+    logger(`📦 Batched filtered import completed: ${succeeded}/${jobs.length} jobs succeeded in ${(duration / 1000).toFixed(2)}s`);
+
+    res.json({
+      success: true,
+      message: `Processed ${jobs.length} jobs (${succeeded} succeeded, ${jobs.length - succeeded} failed)`,
+      jobCount: jobs.length,
+      results,
+      duration: `${(duration / 1000).toFixed(2)}s`
+    });
+
+  } catch (error) {
+    logError('🔥 Batched filtered import failed', error);
+
+    res.status(500).json({
+      success: false,
+      message: 'Batched filtered import failed',
+      error: error.message
+    });
+  }
+}
+
 // Setup function to add routes to Express app
 function setupFilteredImportRoutes(app) {
   // Main filtered data import endpoint
   app.post('/import-filtered-data', importFilteredData);
-  
+
+  // Batched variant - several jobs per request
+  app.post('/import-filtered-data-batch', importFilteredDataBatch);
+
   logger('✅ Filtered import routes registered');
   logger('📍 POST /import-filtered-data - Import data filtered by date range');
+  logger('📍 POST /import-filtered-data-batch - Import multiple filtered exports in one request');
 }
 
 module.exports = {
   setupFilteredImportRoutes,
   importFilteredData,
+  importFilteredDataBatch,
+  runFilteredImportJob,
   EXPORT_ID_MAPPING,
   appendBuildingsData,
   appendCasesData,
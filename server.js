@@ -154,6 +154,8 @@ app.get('/', (req, res) => {
       'GET /import-all - Import all data types',
       'POST /import-filtered-data - Import data filtered by date range (preserves existing data)',
       '  Body: { "id": "export_id", "startDate": "YYYY-MM-DD", "endDate": "YYYY-MM-DD" }',
+      'POST /import-filtered-data-batch - Import multiple filtered exports in one request',
+      '  Body: { "jobs": [ { "id": "export_id", "startDate": "YYYY-MM-DD", "endDate": "YYYY-MM-DD" } ] }',
       'GET /table-info - View table structures and row counts',
       'GET /health - Health check',
       'GET /logs - View recent server logs'